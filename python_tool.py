@@ -5,29 +5,90 @@ Single-file tool: CLI + optional Tkinter GUI
 """
 
 import argparse
+import collections
+import contextlib
+import copy
+import functools
 import itertools
+import math
+import multiprocessing
 import os
 import sys
-
-try:
-    from zxcvbn import zxcvbn
-except Exception as e:
-    print("zxcvbn import failed. Install with: pip install zxcvbn  (or zxcvbn-python)")
-    raise
+import threading
 
 # ---------------------------
 # Password analysis
 # ---------------------------
-def analyze_password(password):
-    """Return the zxcvbn result dict for a password."""
+# zxcvbn's matchers get very slow on long inputs, so only score a prefix;
+# zxcvbn 4.5+ also raises ValueError above its default max_length of 72
+ZXCVBN_MAX_LEN = 72
+
+ZXCVBN_INSTALL_HINT = "zxcvbn import failed. Install with: pip install zxcvbn  (or zxcvbn-python)"
+
+_zxcvbn = None
+
+def _load_zxcvbn():
+    """
+    Import zxcvbn on first use; loading its dictionaries is slow and wordlist-only runs skip it.
+    Raises ImportError (with the install hint) if zxcvbn can't be loaded.
+    """
+    global _zxcvbn
+    if _zxcvbn is None:
+        try:
+            from zxcvbn import zxcvbn
+        except Exception as e:
+            raise ImportError(ZXCVBN_INSTALL_HINT) from e
+        _zxcvbn = zxcvbn
+    return _zxcvbn
+
+def shannon_entropy_bits(s):
+    """Return the total Shannon entropy of a string, in bits."""
+    if not s:
+        return 0.0
+    n = len(s)
+    return sum(c * math.log2(n / c) for c in collections.Counter(s).values())
+
+def _low_entropy_result(entropy):
+    """Build a zxcvbn-shaped result for passwords rejected by the fast path."""
+    return {
+        "score": 0,
+        "entropy": entropy,
+        "crack_times_display": {"offline_fast_hashing_1e10_per_second": "less than a second"},
+        "feedback": {
+            "warning": "Low entropy",
+            "suggestions": ["Use a longer password", "Mix more distinct characters"],
+        },
+    }
+
+@functools.lru_cache(maxsize=1024)
+def _analyze_cached(password):
+    """Run zxcvbn once per distinct password string."""
+    return _load_zxcvbn()(password)
+
+def analyze_password(password, fast=False):
+    """
+    Return the zxcvbn result dict for a password.
+    fast: skip zxcvbn for short or low-entropy passwords (< 2 bits/char)
+    """
     if not password:
         return None
-    return zxcvbn(password)
+    if fast:
+        entropy = shannon_entropy_bits(password)
+        if len(password) < 8 or entropy < 2.0 * len(password):
+            result = _low_entropy_result(entropy)
+            result["truncated"] = False
+            return result
+    # deep copy so callers can't mutate the nested dicts held by the cache
+    result = copy.deepcopy(_analyze_cached(password[:ZXCVBN_MAX_LEN]))
+    result["truncated"] = len(password) > ZXCVBN_MAX_LEN
+    return result
 
 def pretty_print_analysis(result):
     if not result:
         print("No password provided.")
         return
+    if result.get("truncated"):
+        print(f"Note: only the first {ZXCVBN_MAX_LEN} characters were analyzed.")
     print("Score (0-4):", result["score"])
     print("Entropy:", round(result.get("entropy", 0), 2))
     print("Crack time (display):", result["crack_times_display"]["offline_fast_hashing_1e10_per_second"])
@@ -41,39 +102,48 @@ def pretty_print_analysis(result):
 # Wordlist generation helpers
 # ---------------------------
 LEET_MAP = {
-    "a": ["a", "@", "4"],
-    "b": ["b", "8"],
-    "e": ["e", "3"],
-    "i": ["i", "1", "!"],
-    "l": ["l", "1", "7"],
-    "o": ["o", "0"],
-    "s": ["s", "5", "$"],
-    "t": ["t", "7"],
-    "g": ["g", "9"],
+    "a": ("a", "@", "4"),
+    "b": ("b", "8"),
+    "e": ("e", "3"),
+    "i": ("i", "1", "!"),
+    "l": ("l", "1", "7"),
+    "o": ("o", "0"),
+    "s": ("s", "5", "$"),
+    "t": ("t", "7"),
+    "g": ("g", "9"),
 }
 
-COMMON_APPEND = ["", "123", "1234", "2023", "2024", "!", "@", "#", "007"]
+COMMON_APPEND = tuple(sys.intern(ext) for ext in ("", "123", "1234", "2023", "2024", "!", "@", "#", "007"))
+
+# cap on leet variants generated per base word
+LEET_MAX_VARIANTS = 200
 
-def leetspeak_variants(word, max_variants=200):
+@functools.lru_cache(maxsize=128)
+def _char_pool(ch):
+    """Return the leet substitution choices for one (lower-case) character."""
+    return LEET_MAP.get(ch, (ch,))
+
+def leetspeak_variants(word, max_variants=LEET_MAX_VARIANTS):
     """Generate leetspeak substitutions for a word, limit result count."""
     if not word:
         return []
-    pools = []
-    for ch in word.lower():
-        pools.append(LEET_MAP.get(ch, [ch]))
-    # create combinations (cartesian product)
-    combos = itertools.product(*pools)
-    results = []
-    for i, tup in enumerate(combos):
-        results.append("".join(tup))
-        if i+1 >= max_variants:
-            break
-    return list(dict.fromkeys(results))  # remove duplicates while preserving order
+    pools = [_char_pool(ch) for ch in word.lower()]
+    # create combinations (cartesian product), joining each tuple in C.
+    # Every pool holds distinct single characters, so the results are already unique.
+    combos = itertools.islice(itertools.product(*pools), max_variants)
+    return list(map("".join, combos))
 
 def capitalize_variants(word):
-    """Return capitalization variants: lower, title, upper, random-like."""
-    s = word
-    return list(dict.fromkeys([s.lower(), s.title(), s.upper(), s.capitalize()]))
+    """Return capitalization variants: lower, upper, capitalized and title-cased."""
+    lo = word.lower()
+    up = word.upper()
+    if lo == up:  # digits/symbols only
+        return (lo,)
+    cap = word.capitalize()
+    if len(word) > 1 and word.isascii() and word.isalpha():  # title() == capitalize() here
+        return (lo, up, cap)
+    # title() starts a new word after every non-letter ("Mary-Jane", "O'Brien", "T0Mmy")
+    return tuple(dict.fromkeys((lo, up, cap, word.title())))
 
 def build_base_words(user_inputs):
     """Collect base words from user input dict and simple cleanups."""
@@ -88,72 +158,242 @@ def build_base_words(user_inputs):
                 words.add(part)
     return list(words)
 
+def _affixed(words):
+    """Return words with each common pattern appended and prepended, pattern by pattern (may repeat)."""
+    out = []
+    for ext in COMMON_APPEND:
+        out.extend([w + ext for w in words])
+        out.extend([ext + w for w in words])
+    return out
+
 def add_common_patterns(words):
     """Append and prepend common patterns to each word."""
-    out = set()
-    for w in words:
-        for ext in COMMON_APPEND:
-            out.add(w + ext)
-            out.add(ext + w)
-    return list(out)
+    return list(dict.fromkeys(_affixed(words)))
+
+# below this many base words, worker startup costs more than it saves
+PARALLEL_MIN_BASES = 32
+
+# Expansion chunks are lists in a fixed order (never set order), so the words kept under
+# max_words don't depend on PYTHONHASHSEED or on whether the pool was used.
+def _leet_forms(base):
+    """Return the leet variants of one base word and their capitalizations."""
+    forms = []
+    # leet variants (lower-case results from leetspeak_variants)
+    for l in leetspeak_variants(base, max_variants=LEET_MAX_VARIANTS):
+        forms.append(l)
+        # also add capitalization of leet variants
+        forms.extend(capitalize_variants(l))
+    return forms
+
+def _pair_concats(base_words, i):
+    """Return base_words[i] concatenated (both orders) with each later base word."""
+    a = base_words[i]
+    # each unordered pair is visited once, by its earlier word, and emits both orders
+    return list(itertools.chain.from_iterable((a + b, b + a) for b in base_words[i + 1:]))
+
+def _affixed_pairs(base_words, task):
+    """Return the pairs of base_words[i] with one common pattern appended and prepended."""
+    ext, i = task
+    concats = _pair_concats(base_words, i)
+    return [w + ext for w in concats] + [ext + w for w in concats]
+
+def _roundrobin(lists):
+    """Yield the first item of each list, then the second of each, and so on."""
+    for column in itertools.zip_longest(*lists):
+        yield from (w for w in column if w is not None)
+
+def _lazy_imap(pool, func, iterable, ahead):
+    """Like pool.imap, but keep at most `ahead` tasks submitted ahead of the consumer."""
+    pending = collections.deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= ahead:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+NUMERIC_KEYS = ("dob", "birthyear", "year", "numbers", "phone")
+
+def _numeric_patterns(user_inputs):
+    """Yield numeric-only patterns from user inputs (like DOB variants); repeats are dropped downstream."""
+    for key in NUMERIC_KEYS:
+        val = user_inputs.get(key)
+        if not val:
+            continue
+        val = str(val)
+        yield val
+        # common slices
+        if len(val) >= 4:
+            yield val[-2:]  # last two digits
+            yield val[-4:]  # last four digits
+        # common mangles of purely numeric values
+        if val.isdigit():
+            yield val[::-1]  # reversed
+            yield val.zfill(4)  # zero-padded (e.g. lucky number 7 -> 0007)
+            yield val + "!"
+
+# above this many words, dedup with a Bloom filter instead of a set of hashes
+BLOOM_MIN_WORDS = 1_000_000
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, occasional false positives."""
+
+    def __init__(self, m_bits, k_hashes=7):
+        self.m_bits = max(8, m_bits)
+        self.k_hashes = k_hashes
+        self.bits = bytearray((self.m_bits + 7) // 8)
+
+    def _positions(self, item):
+        # Kirsch-Mitzenmacher: k indexes h1 + i*h2, with h2 taken from h1's high bits
+        h1 = hash(item)
+        m = self.m_bits
+        p = h1 % m
+        step = ((h1 >> 32) | 1) % m
+        for _ in range(self.k_hashes):
+            yield p
+            p = (p + step) % m
+
+    def maybe_contains(self, item):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item):
+        """Set the item's bits; return True if any was unset, i.e. the item is definitely new."""
+        bits = self.bits
+        new = False
+        for p in self._positions(item):
+            mask = 1 << (p & 7)
+            if not bits[p >> 3] & mask:
+                bits[p >> 3] |= mask
+                new = True
+        return new
+
+# hard ceiling on the Bloom filter (256 MiB), whatever the requested cap
+BLOOM_MAX_BITS = 1 << 31
+
+def _candidate_bound(base_words):
+    """Return an upper bound on how many candidates iter_wordlist can produce."""
+    n = len(base_words)
+    per_pattern = 2 * len(COMMON_APPEND)
+    per_base = 4 + 5 * LEET_MAX_VARIANTS  # capitalizations, plus leet variants and their capitalizations
+    return 6 * len(NUMERIC_KEYS) + per_pattern * (per_base * n + n * (n - 1))
+
+def _unique(words, expected):
+    """
+    Yield words not seen before; expected is how many unique words will be kept at most.
+    Small runs track word hashes, so only a (very unlikely) hash collision drops a word;
+    runs of BLOOM_MIN_WORDS or more use a ~1% false-positive Bloom filter (~10 bits/word).
+    """
+    if expected >= BLOOM_MIN_WORDS:
+        bloom = BloomFilter(min(10 * expected, BLOOM_MAX_BITS), 7)
+        for w in words:
+            if bloom.add(w):
+                yield w
+    else:
+        seen = set()
+        for w in words:
+            h = hash(w)
+            if h not in seen:
+                seen.add(h)
+                yield w
+
+def iter_wordlist(user_inputs, max_words=500):
+    """
+    Yield up to max_words unique candidate words from user inputs as they are produced.
+    Words come out in tiers, most likely first, so a small max_words still covers every input:
+    numeric patterns, capitalizations, raw pairs, leet forms, then common patterns.
+    """
+    max_words = max(0, max_words)  # a negative limit yields nothing rather than erroring
+    # longest (most specific) words first, so a tight max_words keeps the best pairs
+    base_words = sorted(build_base_words(user_inputs), key=lambda w: (-len(w), w))
+    indices = range(len(base_words))
+    exts = [ext for ext in COMMON_APPEND if ext]
+
+    # 1) capitalization variants of every base word, then 2) pairwise concatenations,
+    # then 3) leet variants, interleaved across base words so none takes the whole budget
+    caps = list(itertools.chain.from_iterable(map(capitalize_variants, base_words)))
+    pairs = itertools.chain.from_iterable(_pair_concats(base_words, i) for i in indices)
+    leet = list(_roundrobin([_leet_forms(base) for base in base_words]))
+    words = caps + leet
+
+    # 4) append/prepend common patterns, one pattern at a time: first to the single-word
+    # variants, then to the pairs (the O(n^2) bulk, split per pattern and left operand)
+    def single_patterns():
+        for ext in exts:
+            yield from (w + ext for w in words)
+            yield from (ext + w for w in words)
+
+    cpus = os.cpu_count() or 1
+    parallel = cpus > 1 and len(base_words) >= PARALLEL_MIN_BASES
+    with multiprocessing.Pool(cpus) if parallel else contextlib.nullcontext() as pool:
+        if parallel:
+            imap = functools.partial(_lazy_imap, pool, ahead=2 * cpus)
+        else:
+            imap = map
+        # Everything is produced lazily (the pool only runs a small window ahead), so once
+        # max_words is reached no further variants or pairs are expanded.
+        pair_tasks = itertools.product(exts, indices)
+        stream = itertools.chain(
+            _numeric_patterns(user_inputs),
+            caps,
+            pairs,
+            leet,
+            single_patterns(),
+            itertools.chain.from_iterable(imap(functools.partial(_affixed_pairs, base_words), pair_tasks)),
+        )
+        # size dedup for what the inputs can actually yield, not a huge "no limit" cap
+        expected = min(max_words, _candidate_bound(base_words))
+        yield from itertools.islice(_unique(stream, expected), max_words)
 
 def generate_wordlist(user_inputs, max_per_base=500):
     """
     Generate a list of candidate words from user inputs.
     user_inputs: dict with keys like name, dob, pet, fav, numbers
     """
-    base_words = build_base_words(user_inputs)
-    generated = set()
-
-    # 1) For each base word add capitalization and leet variants
-    for base in base_words:
-        # capitalization variants
-        for cap in capitalize_variants(base):
-            generated.add(cap)
-        # leet variants (lower-case results from leetspeak_variants)
-        for l in leetspeak_variants(base, max_variants=200):
-            generated.add(l)
-            # also add capitalization of leet variants
-            for cap in capitalize_variants(l):
-                generated.add(cap)
-
-    # 2) Combine base words with each other (pairwise concatenations)
-    for a, b in itertools.permutations(base_words, 2):
-        generated.add(a + b)
-        generated.add(b + a)
-
-    # 3) Append/prepend common patterns to generated words
-    with_patterns = set(add_common_patterns(list(generated)))
-
-    # 4) Add numeric-only patterns from user inputs (like DOB variants)
-    for key in ("dob", "birthyear", "year", "numbers", "phone"):
-        if key in user_inputs and user_inputs[key]:
-            val = str(user_inputs[key])
-            with_patterns.add(val)
-            # common slices
-            if len(val) >= 4:
-                with_patterns.add(val[-2:])  # last two digits
-                with_patterns.add(val[-4:])  # last four digits
-
-    # limit size if huge
-    final_list = list(with_patterns)
-    if len(final_list) > max_per_base:
-        final_list = final_list[:max_per_base]
-
-    # ensure uniqueness and return
-    return list(dict.fromkeys(final_list))
+    return list(iter_wordlist(user_inputs, max_words=max_per_base))
 
 # ---------------------------
 # Export
 # ---------------------------
-def export_wordlist(wordlist, filename="custom_wordlist.txt"):
-    if not wordlist:
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_CHUNK_WORDS = 1000
+
+def _write_wordlist(wordlist, filename):
+    """
+    Write words (any iterable, consumed once) to filename; return the count written.
+    Words go to a temporary file next to filename, which replaces it only once generation
+    has finished, so a failure part-way leaves any previous wordlist untouched.
+    """
+    words = iter(wordlist)
+    chunk = list(itertools.islice(words, EXPORT_CHUNK_WORDS))
+    if not chunk:
+        return 0
+    count = 0
+    tmp = filename + ".tmp"
+    try:
+        with open(tmp, "wb", buffering=EXPORT_BUFFER_SIZE) as f:
+            while chunk:
+                # one join + one encode per chunk rather than an encode and a concat per word
+                f.write(("\n".join(chunk) + "\n").encode("utf-8"))
+                count += len(chunk)
+                chunk = list(itertools.islice(words, EXPORT_CHUNK_WORDS))
+        os.replace(tmp, filename)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+    return count
+
+def _print_export_result(count, filename):
+    if count:
+        print(f"Exported {count} entries to {filename}")
+    else:
         print("No words to export.")
-        return
-    with open(filename, "w", encoding="utf-8") as f:
-        for w in wordlist:
-            f.write(w + "\n")
-    print(f"Exported {len(wordlist)} entries to {filename}")
+
+def export_wordlist(wordlist, filename="custom_wordlist.txt"):
+    """Write words (any iterable, consumed once) to filename; return the count written."""
+    count = _write_wordlist(wordlist, filename)
+    _print_export_result(count, filename)
+    return count
 
 # ---------------------------
 # CLI handling
@@ -172,19 +412,29 @@ def cli_main(args):
     # Password analysis if provided
     if args.password:
         print("\n=== Password Analysis ===")
-        res = analyze_password(args.password)
-        pretty_print_analysis(res)
+        try:
+            res = analyze_password(args.password, fast=args.fast)
+        except ImportError:
+            print(ZXCVBN_INSTALL_HINT)
+        else:
+            pretty_print_analysis(res)
 
     # Generate wordlist if requested
     if args.generate or args.name or args.pet or args.fav or args.dob or args.numbers or args.phone:
         print("\n=== Generating Wordlist ===")
-        wordlist = generate_wordlist(user_inputs, max_per_base=args.max_words)
-        print(f"Generated {len(wordlist)} candidate words.")
+        words = iter_wordlist(user_inputs, max_words=args.max_words)
+        sample = []
         if args.show:
+            sample = list(itertools.islice(words, 50))
+            words = itertools.chain(sample, words)
+        # stream to disk first so the count is known; report in the usual order afterwards
+        count = _write_wordlist(words, args.output)
+        print(f"Generated {count} candidate words.")
+        if sample:
             print("\n--- Sample words ---")
-            for i, w in enumerate(wordlist[:min(50, len(wordlist))], 1):
+            for i, w in enumerate(sample, 1):
                 print(f"{i}. {w}")
-        export_wordlist(wordlist, args.output)
+        _print_export_result(count, args.output)
 
 # ---------------------------
 # Simple Tkinter GUI
@@ -202,7 +452,11 @@ def run_gui():
         if not pwd:
             messagebox.showinfo("Info", "Enter a password to analyze.")
             return
-        res = analyze_password(pwd)
+        try:
+            res = analyze_password(pwd)
+        except ImportError:
+            messagebox.showerror("Error", ZXCVBN_INSTALL_HINT)
+            return
         score_str = str(res["score"]) if res else "N/A"
         entropy_str = str(round(res.get("entropy", 0), 2)) if res else "N/A"
         crack = res["crack_times_display"]["offline_fast_hashing_1e10_per_second"] if res else "N/A"
@@ -221,11 +475,24 @@ def run_gui():
             "numbers": numbers_entry.get(),
             "phone": phone_entry.get(),
         }
-        words = generate_wordlist(ui, max_per_base=2000)
-        messagebox.showinfo("Generated", f"Generated {len(words)} words. Choose file to save.")
         fpath = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files","*.txt")], title="Save wordlist as")
-        if fpath:
-            export_wordlist(words, fpath)
+        if not fpath:
+            return
+        # stream straight to the file instead of holding the whole list in memory
+        count = export_wordlist(iter_wordlist(ui, max_words=2000), fpath)
+        if count:
+            messagebox.showinfo("Generated", f"Generated {count} words and saved them to {fpath}.")
+        else:
+            messagebox.showinfo("Info", "Enter some details to generate a wordlist.")
+
+    def warm_up():
+        try:
+            _load_zxcvbn()("warmup")
+        except Exception:
+            pass  # reported when the user actually clicks Analyze
+
+    # load zxcvbn's dictionaries in the background so the first Analyze click is fast
+    threading.Thread(target=warm_up, daemon=True).start()
 
     root = tk.Tk()
     root.title("Password Analyzer & Wordlist Generator")
@@ -270,6 +537,7 @@ def run_gui():
 def main():
     parser = argparse.ArgumentParser(description="Password Analyzer & Custom Wordlist Generator")
     parser.add_argument("--password", "-p", help="Password to analyze")
+    parser.add_argument("--fast", action="store_true", help="Skip zxcvbn for short/low-entropy passwords")
     parser.add_argument("--name", help="Name (for wordlist)")
     parser.add_argument("--dob", help="DOB or birth year")
     parser.add_argument("--pet", help="Pet name")